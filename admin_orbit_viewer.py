@@ -3,12 +3,36 @@ from __future__ import annotations
 import json
 import math
 import socket
+import threading
 import time
-from collections import defaultdict, deque
-from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pygame
 
+# Fastest available JSON parser wins; all of them take bytes and return the
+# same dicts, so the rest of the viewer does not care which one loaded.
+try:
+    from msgspec.json import decode as json_loads
+except ImportError:
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+# Matching encoder chain: all three produce UTF-8 bytes ready for sendall.
+try:
+    from msgspec.json import encode as json_dumps
+except ImportError:
+    try:
+        from orjson import dumps as json_dumps
+    except ImportError:
+
+        def json_dumps(payload: Any) -> bytes:
+            return json.dumps(payload).encode("utf-8")
+
 WINDOW_WIDTH = 900
 WINDOW_HEIGHT = 900
 TRAIL_LENGTH = 300
@@ -56,14 +80,23 @@ SIM_SPEED_KEYS = {
 
 
 class ServerConnection:
+    """Connection shared between the reader thread and main-thread senders.
+
+    A lock guards socket setup and teardown so a failing send cannot clobber
+    the socket mid-reconnect; shutdown is signalled via the running flag,
+    after which readline returns empty bytes.
+    """
+
     def __init__(self) -> None:
         self.addr = (SERVER_HOST, SERVER_PORT)
         self.sock: Optional[socket.socket] = None
         self.sock_file: Optional[Any] = None
+        self.running = True
+        self._lock = threading.Lock()
         self.connect()
 
     def connect(self) -> None:
-        while True:
+        while self.running:
             try:
                 sock = socket.create_connection(self.addr, timeout=5)
             except OSError:
@@ -73,12 +106,33 @@ class ServerConnection:
                 )
                 time.sleep(1.0)
                 continue
-            self.sock = sock
-            self.sock_file = sock.makefile("r", encoding="utf-8")
+            # Snapshots are latency-sensitive one-line messages; disable
+            # Nagle so time-scale commands go out immediately, and give the
+            # kernel room to absorb a large snapshot between reads.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            with self._lock:
+                if not self.running:
+                    sock.close()
+                    return
+                self.sock = sock
+                # Binary mode with a large read buffer: fewer recv syscalls
+                # per snapshot, and no UTF-8 decode since the parser accepts
+                # bytes.
+                self.sock_file = sock.makefile("rb", buffering=1 << 16)
             print("Connected to GGW server.", flush=True)
             break
 
     def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self.running = False
+            self._close_locked()
+
+    def _close_locked(self) -> None:
         if self.sock_file is not None:
             try:
                 self.sock_file.close()
@@ -92,30 +146,44 @@ class ServerConnection:
         self.sock = None
         self.sock_file = None
 
-    def readline(self) -> str:
-        while True:
-            if self.sock_file is None:
+    def readline(self) -> bytes:
+        while self.running:
+            sock_file = self.sock_file
+            if sock_file is None:
                 self.connect()
                 continue
             try:
-                line = self.sock_file.readline()
-            except OSError:
+                line = sock_file.readline()
+            except (OSError, ValueError):
+                # ValueError: another thread closed the file under us while
+                # reconnecting after a failed send.
                 self.close()
                 continue
-            if line == "":
+            if not line:
+                if not self.running:
+                    break
                 print("Connection to GGW server lost, reconnecting...", flush=True)
                 self.close()
                 continue
             return line
+        return b""
 
     def send_json(self, payload: Dict[str, Any]) -> None:
-        data = (json.dumps(payload) + "\n").encode("utf-8")
-        while True:
-            if self.sock is None:
+        self._send_bytes(json_dumps(payload) + b"\n")
+
+    def send_set_time_scale(self, time_scale: float) -> None:
+        # The one command this viewer sends has a fixed shape; formatting the
+        # template directly skips a json.dumps round trip per keypress.
+        self._send_bytes(b'{"type":"set_time_scale","time_scale":%f}\n' % time_scale)
+
+    def _send_bytes(self, data: bytes) -> None:
+        while self.running:
+            sock = self.sock
+            if sock is None:
                 self.connect()
+                continue
             try:
-                assert self.sock is not None
-                self.sock.sendall(data)
+                sock.sendall(data)
                 return
             except OSError:
                 print("Send failed, reconnecting to GGW server...", flush=True)
@@ -123,18 +191,34 @@ class ServerConnection:
 
 
 class ViewerState:
+    __slots__ = (
+        "base_scale",
+        "zoom_factor",
+        "zoom_factor_min",
+        "zoom_factor_max",
+        "camera_center_world",
+        "is_panning",
+        "pan_start_mouse",
+        "pan_start_center",
+        "selected_id",
+        "selected_planet",
+        "sim_speed",
+        "_planet_cache",
+    )
+
     def __init__(self) -> None:
         self.base_scale: Optional[float] = None
         self.zoom_factor: float = 1.0
         self.zoom_factor_min: float = 1e-4
         self.zoom_factor_max: Optional[float] = None
-        self.camera_center_world: List[float] = [0.0, 0.0]
+        self.camera_center_world: np.ndarray = np.zeros(2, dtype=np.float64)
         self.is_panning: bool = False
         self.pan_start_mouse: Tuple[int, int] = (0, 0)
         self.pan_start_center: Tuple[float, float] = (0.0, 0.0)
         self.selected_id: Optional[int] = None
         self.selected_planet: bool = False
         self.sim_speed: float = 10.0
+        self._planet_cache: Optional[Tuple[tuple, pygame.Surface]] = None
 
 
 def init_pygame() -> pygame.Surface:
@@ -158,11 +242,15 @@ def ensure_base_scale(snapshot: Dict, state: ViewerState) -> None:
     if state.base_scale is not None:
         return
 
-    bodies = snapshot.get("bodies", [])
     max_r = snapshot.get("planet_radius_m", 0.0)
-    for body in bodies:
-        dist = math.hypot(body.get("x", 0.0), body.get("y", 0.0))
-        max_r = max(max_r, dist)
+    if snapshot.get("bodies"):
+        xy = snapshot.get("_xy")
+        if xy is None:
+            prepare_snapshot(snapshot)
+            xy = snapshot["_xy"]
+        # Compare squared distances and take one sqrt at the end.
+        dist_sq = xy[:, 0] * xy[:, 0] + xy[:, 1] * xy[:, 1]
+        max_r = max(max_r, math.sqrt(float(dist_sq.max())))
     if max_r <= 0.0:
         max_r = 1.0
 
@@ -177,7 +265,7 @@ def ensure_base_scale(snapshot: Dict, state: ViewerState) -> None:
     max_zoom = max(state.zoom_factor_min, 1.0 / base_scale)
     state.zoom_factor_max = max_zoom
     state.zoom_factor = clamp(state.zoom_factor, state.zoom_factor_min, state.zoom_factor_max)
-    state.camera_center_world = [0.0, 0.0]
+    state.camera_center_world[:] = 0.0
 
 
 def world_to_screen(
@@ -195,6 +283,47 @@ def world_to_screen(
     return int(screen_x), int(screen_y)
 
 
+_proj_scratch = np.empty((0, 2), dtype=np.float64)
+_proj_scratch_px = np.empty((0, 2), dtype=np.int32)
+
+
+def _projection_scratch(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return float and pixel scratch views of at least n rows, grown
+    geometrically so steady-state frames allocate nothing."""
+    global _proj_scratch, _proj_scratch_px
+    if _proj_scratch.shape[0] < n:
+        capacity = max(n, 2 * _proj_scratch.shape[0], 512)
+        _proj_scratch = np.empty((capacity, 2), dtype=np.float64)
+        _proj_scratch_px = np.empty((capacity, 2), dtype=np.int32)
+    return _proj_scratch[:n], _proj_scratch_px[:n]
+
+
+def project_points(
+    points: Any,
+    cam_center: Sequence[float],
+    base_scale: float,
+    zoom_factor: float,
+) -> np.ndarray:
+    """Project an (N, 2) array of world points to screen pixels in one pass.
+
+    The result is a view of a shared scratch buffer and is only valid until
+    the next call; callers hand it straight to a draw function.
+    """
+    # Fold camera offset and window centre into the affine constants so each
+    # column takes one multiply and one add.
+    scale = base_scale * zoom_factor
+    offset_x = WINDOW_WIDTH / 2.0 - cam_center[0] * scale
+    offset_y = WINDOW_HEIGHT / 2.0 + cam_center[1] * scale
+    pts = np.asarray(points, dtype=np.float64)
+    screen, screen_px = _projection_scratch(pts.shape[0])
+    np.multiply(pts[:, 0], scale, out=screen[:, 0])
+    np.multiply(pts[:, 1], -scale, out=screen[:, 1])
+    screen[:, 0] += offset_x
+    screen[:, 1] += offset_y
+    screen_px[...] = screen
+    return screen_px
+
+
 def screen_to_world(
     sx: float,
     sy: float,
@@ -212,22 +341,94 @@ def screen_to_world(
     return wx, wy
 
 
+def viewport_world_bounds(
+    cam_center: Sequence[float],
+    base_scale: float,
+    zoom_factor: float,
+) -> Tuple[float, float, float, float]:
+    """Return (wx_min, wx_max, wy_min, wy_max) covered by the window, with a
+    small pixel margin so primitives straddling an edge are not rejected."""
+    pad = 8.0
+    wx0, wy0 = screen_to_world(-pad, -pad, cam_center, base_scale, zoom_factor)
+    wx1, wy1 = screen_to_world(
+        WINDOW_WIDTH + pad, WINDOW_HEIGHT + pad, cam_center, base_scale, zoom_factor
+    )
+    return min(wx0, wx1), max(wx0, wx1), min(wy0, wy1), max(wy0, wy1)
+
+
 def meters_to_pixels(radius_m: float, base_scale: float, zoom_factor: float) -> int:
     scale = base_scale * zoom_factor
     pixels = int(radius_m * scale)
     return max(1, abs(pixels))
 
 
-def update_trails(trails: Dict[int, Deque[Tuple[float, float]]], snapshot: Dict) -> None:
+class Trail:
+    """Fixed-capacity ring buffer of world points.
+
+    Appending writes into a preallocated array instead of allocating a tuple
+    per snapshot the way a deque of (x, y) pairs would.
+    """
+
+    __slots__ = ("buf", "head", "count")
+
+    def __init__(self) -> None:
+        self.buf = np.empty((TRAIL_LENGTH, 2), dtype=np.float64)
+        self.head = 0
+        self.count = 0
+
+    def append(self, x: float, y: float) -> None:
+        self.buf[self.head, 0] = x
+        self.buf[self.head, 1] = y
+        self.head = (self.head + 1) % TRAIL_LENGTH
+        if self.count < TRAIL_LENGTH:
+            self.count += 1
+
+    def points(self) -> np.ndarray:
+        """Return the stored points oldest-first."""
+        if self.count < TRAIL_LENGTH:
+            return self.buf[: self.count]
+        return np.concatenate((self.buf[self.head:], self.buf[: self.head]))
+
+
+def make_trails() -> Dict[int, Trail]:
+    return defaultdict(Trail)
+
+
+def prepare_snapshot(snapshot: Dict) -> None:
+    """Extract struct-of-arrays columns from a freshly parsed snapshot.
+
+    The wire format stays NDJSON because the protocol is shared with the
+    interior viewer and hand-written on the Rust side, but the per-frame hot
+    paths work on these columns instead of re-walking the body dicts.
+    """
+    bodies = snapshot.get("bodies", [])
+    n = len(bodies)
+    ids = np.empty(n, dtype=np.int64)
+    xy = np.empty((n, 2), dtype=np.float64)
+    radii = np.empty(n, dtype=np.float64)
+    colors = []
+    by_id = {}
+    default_color = COLORS["fg_main"]
+    for i, body in enumerate(bodies):
+        ids[i] = body["id"]
+        xy[i, 0] = body.get("x", 0.0)
+        xy[i, 1] = body.get("y", 0.0)
+        radii[i] = body.get("radius_m", 10.0)
+        colors.append(BODY_COLORS.get(body.get("body_type"), default_color))
+        by_id[body["id"]] = body
+    snapshot["_ids"] = ids
+    snapshot["_xy"] = xy
+    snapshot["_radius_m"] = radii
+    snapshot["_colors"] = colors
+    snapshot["_by_id"] = by_id
+
+
+def update_trails(trails: Dict[int, Trail], snapshot: Dict) -> None:
     for body in snapshot.get("bodies", []):
-        body_id = body["id"]
-        trail = trails[body_id]
-        trail.append((body.get("x", 0.0), body.get("y", 0.0)))
-        if len(trail) > TRAIL_LENGTH:
-            trail.popleft()
+        trails[body["id"]].append(body.get("x", 0.0), body.get("y", 0.0))
 
 
-def prune_trails(trails: Dict[int, Deque[Tuple[float, float]]], current_ids: Iterable[int]) -> None:
+def prune_trails(trails: Dict[int, Trail], current_ids: Iterable[int]) -> None:
     valid = set(current_ids)
     for body_id in list(trails.keys()):
         if body_id not in valid:
@@ -236,10 +437,26 @@ def prune_trails(trails: Dict[int, Deque[Tuple[float, float]]], current_ids: Ite
 
 def set_sim_speed(conn: ServerConnection, state: ViewerState, new_speed: float) -> None:
     state.sim_speed = new_speed
-    conn.send_json({"type": "set_time_scale", "time_scale": new_speed})
+    conn.send_set_time_scale(new_speed)
+
+
+def apply_pan(state: ViewerState, mouse_pos: Tuple[int, int]) -> None:
+    if state.base_scale is None:
+        return
+    scale = state.base_scale * state.zoom_factor
+    if scale > 0.0:
+        inv_scale = 1.0 / scale
+        dx = mouse_pos[0] - state.pan_start_mouse[0]
+        dy = mouse_pos[1] - state.pan_start_mouse[1]
+        state.camera_center_world[0] = state.pan_start_center[0] - dx * inv_scale
+        state.camera_center_world[1] = state.pan_start_center[1] + dy * inv_scale
 
 
 def handle_events(snapshot: Optional[Dict], state: ViewerState, conn: ServerConnection) -> bool:
+    # Wheel ticks and pan motion are coalesced across the event batch and
+    # applied once; intermediate positions cannot be seen anyway.
+    net_wheel = 0
+    pan_pos: Optional[Tuple[int, int]] = None
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             return False
@@ -248,15 +465,12 @@ def handle_events(snapshot: Optional[Dict], state: ViewerState, conn: ServerConn
                 return False
             if event.key in SIM_SPEED_KEYS:
                 set_sim_speed(conn, state, SIM_SPEED_KEYS[event.key])
-        if event.type == pygame.MOUSEWHEEL and state.base_scale is not None:
-            if event.y > 0:
-                state.zoom_factor *= ZOOM_STEP
-            elif event.y < 0:
-                state.zoom_factor /= ZOOM_STEP
-            state.zoom_factor = max(state.zoom_factor, state.zoom_factor_min)
-            if state.zoom_factor_max is not None:
-                state.zoom_factor = min(state.zoom_factor, state.zoom_factor_max)
+        if event.type == pygame.MOUSEWHEEL:
+            net_wheel += event.y
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if pan_pos is not None and state.is_panning:
+                apply_pan(state, pan_pos)
+                pan_pos = None
             if snapshot is not None and state.base_scale is not None:
                 if attempt_selection(snapshot, state, event.pos):
                     continue
@@ -266,18 +480,19 @@ def handle_events(snapshot: Optional[Dict], state: ViewerState, conn: ServerConn
             state.pan_start_mouse = event.pos
             state.pan_start_center = tuple(state.camera_center_world)
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            if pan_pos is not None and state.is_panning:
+                apply_pan(state, pan_pos)
+                pan_pos = None
             state.is_panning = False
-        if (
-            event.type == pygame.MOUSEMOTION
-            and state.is_panning
-            and state.base_scale is not None
-        ):
-            scale = state.base_scale * state.zoom_factor
-            if scale > 0.0:
-                dx = event.pos[0] - state.pan_start_mouse[0]
-                dy = event.pos[1] - state.pan_start_mouse[1]
-                state.camera_center_world[0] = state.pan_start_center[0] - dx / scale
-                state.camera_center_world[1] = state.pan_start_center[1] + dy / scale
+        if event.type == pygame.MOUSEMOTION and state.is_panning:
+            pan_pos = event.pos
+    if net_wheel and state.base_scale is not None:
+        state.zoom_factor *= ZOOM_STEP ** net_wheel
+        state.zoom_factor = max(state.zoom_factor, state.zoom_factor_min)
+        if state.zoom_factor_max is not None:
+            state.zoom_factor = min(state.zoom_factor, state.zoom_factor_max)
+    if pan_pos is not None and state.is_panning:
+        apply_pan(state, pan_pos)
     return True
 
 
@@ -286,22 +501,21 @@ def find_body_under_cursor(
 ) -> Optional[int]:
     if snapshot is None or state.base_scale is None:
         return None
-    bodies = snapshot.get("bodies", [])
-    best_id = None
-    best_dist = PICK_RADIUS_PX
-    for body in bodies:
-        sx, sy = world_to_screen(
-            body["x"],
-            body["y"],
-            state.camera_center_world,
-            state.base_scale,
-            state.zoom_factor,
-        )
-        dist = math.hypot(mouse_pos[0] - sx, mouse_pos[1] - sy)
-        if dist <= best_dist:
-            best_dist = dist
-            best_id = body["id"]
-    return best_id
+    if not snapshot.get("bodies"):
+        return None
+    xy = snapshot.get("_xy")
+    if xy is None:
+        prepare_snapshot(snapshot)
+        xy = snapshot["_xy"]
+    cam_center = state.camera_center_world
+    scale = state.base_scale * state.zoom_factor
+    dx = WINDOW_WIDTH / 2.0 + (xy[:, 0] - cam_center[0]) * scale - mouse_pos[0]
+    dy = WINDOW_HEIGHT / 2.0 - (xy[:, 1] - cam_center[1]) * scale - mouse_pos[1]
+    dist_sq = dx * dx + dy * dy
+    best = int(np.argmin(dist_sq))
+    if dist_sq[best] > PICK_RADIUS_PX * PICK_RADIUS_PX:
+        return None
+    return int(snapshot["_ids"][best])
 
 
 def attempt_selection(snapshot: Dict, state: ViewerState, mouse_pos: Tuple[int, int]) -> bool:
@@ -336,11 +550,11 @@ def update_camera_center(snapshot: Dict, state: ViewerState) -> None:
     if state.base_scale is None:
         return
     if state.selected_planet:
-        state.camera_center_world = [0.0, 0.0]
+        state.camera_center_world[:] = 0.0
         return
     if state.selected_id is None:
         return
-    body = next((b for b in snapshot.get("bodies", []) if b["id"] == state.selected_id), None)
+    body = snapshot.get("_by_id", {}).get(state.selected_id)
     if body is None:
         state.selected_id = None
         return
@@ -348,10 +562,28 @@ def update_camera_center(snapshot: Dict, state: ViewerState) -> None:
     state.camera_center_world[1] = body.get("y", 0.0)
 
 
+DISC_SPRITE_MAX_RADIUS_PX = 64
+
+
+@lru_cache(maxsize=512)
+def _disc_sprite(color: Tuple[int, int, int], radius_px: int) -> pygame.Surface:
+    """Rasterize a filled disc once per (color, radius) and blit it after.
+
+    Most bodies share a handful of on-screen radii at any zoom level, so the
+    per-frame cost collapses to one screen.blits call instead of a software
+    circle rasterization per body. Large discs stay on draw.circle to keep
+    the cache small.
+    """
+    side = 2 * radius_px + 1
+    surface = pygame.Surface((side, side), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (radius_px, radius_px), radius_px)
+    return surface
+
+
 def draw_snapshot(
     screen: pygame.Surface,
     snapshot: Dict,
-    trails: Dict[int, Deque[Tuple[float, float]]],
+    trails: Dict[int, Trail],
     state: ViewerState,
 ) -> None:
     if state.base_scale is None:
@@ -365,69 +597,72 @@ def draw_snapshot(
     cam_center = state.camera_center_world
 
     origin_px = world_to_screen(0.0, 0.0, cam_center, base_scale, zoom_factor)
-    planet_radius_m = snapshot.get("planet_radius_m", 6_371_000.0)
-    gravity_well_radius = snapshot.get("gravity_well_radius_m")
-    despawn_radius = snapshot.get("despawn_radius_m")
-
-    planet_px = meters_to_pixels(planet_radius_m, base_scale, zoom_factor)
-    pygame.draw.circle(screen, COLORS["planet_fill"], origin_px, planet_px)
-    pygame.draw.circle(screen, COLORS["planet_outline"], origin_px, planet_px, width=2)
-    if state.selected_planet:
-        pygame.draw.circle(
-            screen,
-            COLORS["fg_highlight"],
-            origin_px,
-            max(planet_px + 4, planet_px + 1),
-            width=2,
-        )
+    draw_planet_layers(screen, snapshot, state, origin_px, base_scale, zoom_factor)
 
-    draw_optional_ring(
-        screen,
-        origin_px,
-        gravity_well_radius,
-        base_scale,
-        zoom_factor,
-        COLORS["ring_gravity"],
-    )
-    draw_optional_ring(
-        screen,
-        origin_px,
-        despawn_radius,
-        base_scale,
-        zoom_factor,
-        COLORS["ring_despawn"],
-    )
-
-    for body_id, trail in trails.items():
-        if len(trail) < 2:
-            continue
-        projected = [
-            world_to_screen(wx, wy, cam_center, base_scale, zoom_factor)
-            for wx, wy in trail
-        ]
-        color = COLORS["trail"]
-        width = 1
-        if state.selected_id == body_id:
-            color = COLORS["fg_highlight"]
-            width = 2
-        pygame.draw.lines(screen, color, False, projected, width)
+    view_bounds = viewport_world_bounds(cam_center, base_scale, zoom_factor)
+    draw_trails(screen, trails, state, cam_center, base_scale, zoom_factor, view_bounds)
 
     selected_id = state.selected_id
-    for body in snapshot.get("bodies", []):
-        color = BODY_COLORS.get(body.get("body_type"), COLORS["fg_main"])
-        radius_px = meters_to_pixels(body.get("radius_m", 10.0), base_scale, zoom_factor)
-        sx, sy = world_to_screen(
-            body.get("x", 0.0),
-            body.get("y", 0.0),
-            cam_center,
-            base_scale,
-            zoom_factor,
+    bodies = snapshot.get("bodies", [])
+    if bodies:
+        body_xy = snapshot.get("_xy")
+        if body_xy is None:
+            prepare_snapshot(snapshot)
+            body_xy = snapshot["_xy"]
+        radii = snapshot["_radius_m"]
+        wx_min, wx_max, wy_min, wy_max = view_bounds
+        visible = (
+            (body_xy[:, 0] + radii >= wx_min)
+            & (body_xy[:, 0] - radii <= wx_max)
+            & (body_xy[:, 1] + radii >= wy_min)
+            & (body_xy[:, 1] - radii <= wy_max)
         )
-        pygame.draw.circle(screen, color, (sx, sy), radius_px)
-        draw_ship_outline(screen, body, cam_center, base_scale, zoom_factor)
-        if selected_id == body.get("id"):
-            pygame.draw.circle(screen, COLORS["fg_highlight"], (sx, sy), radius_px + 3, width=1)
-            pygame.draw.circle(screen, COLORS["fg_highlight"], (sx, sy), radius_px + 6, width=1)
+        indices = np.flatnonzero(visible)
+        body_screen = project_points(body_xy[indices], cam_center, base_scale, zoom_factor)
+        # One vectorized pass replaces a meters_to_pixels call per body.
+        radii_px = np.abs(radii[indices] * (base_scale * zoom_factor)).astype(np.int32)
+        np.maximum(radii_px, 1, out=radii_px)
+        draw_circle = pygame.draw.circle
+        # Batch the plain discs by color so consecutive draw calls share
+        # renderer state, then add per-body overlays in a second pass.
+        discs: Dict[Tuple[int, int, int], List[Tuple[int, int, int]]] = defaultdict(list)
+        dots: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = defaultdict(list)
+        body_colors = snapshot["_colors"]
+        for i, (sx, sy), radius_px in zip(indices, body_screen, radii_px):
+            color = body_colors[i]
+            if radius_px <= 1:
+                dots[color].append((sx, sy))
+            else:
+                discs[color].append((sx, sy, radius_px))
+        blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        for color, batch in discs.items():
+            for sx, sy, radius_px in batch:
+                if radius_px <= DISC_SPRITE_MAX_RADIUS_PX:
+                    blits.append(
+                        (_disc_sprite(color, radius_px), (sx - radius_px, sy - radius_px))
+                    )
+                else:
+                    draw_circle(screen, color, (sx, sy), radius_px)
+        if blits:
+            screen.blits(blits, doreturn=False)
+        if dots:
+            # Zoomed out, most bodies are single pixels; write them straight
+            # into the framebuffer instead of one SDL call per body.
+            pixels = pygame.surfarray.pixels2d(screen)
+            for color, pts in dots.items():
+                arr = np.asarray(pts, dtype=np.int32)
+                xs, ys = arr[:, 0], arr[:, 1]
+                on_screen = (
+                    (xs >= 0) & (xs < WINDOW_WIDTH) & (ys >= 0) & (ys < WINDOW_HEIGHT)
+                )
+                pixels[xs[on_screen], ys[on_screen]] = screen.map_rgb(color)
+            del pixels
+        for i, (sx, sy), radius_px in zip(indices, body_screen, radii_px):
+            body = bodies[i]
+            draw_ship_outline(screen, body, cam_center, base_scale, zoom_factor)
+            if selected_id == body.get("id"):
+                draw_circle(screen, COLORS["fg_highlight"], (sx, sy), radius_px + 3, width=1)
+                draw_circle(screen, COLORS["fg_highlight"], (sx, sy), radius_px + 6, width=1)
 
     draw_hud(screen, snapshot, state)
     draw_scale_marker(screen, state)
@@ -436,22 +671,153 @@ def draw_snapshot(
     pygame.display.flip()
 
 
-def draw_optional_ring(
+def decimate_polyline(points_px: np.ndarray) -> np.ndarray:
+    """Drop consecutive points that land on the same pixel.
+
+    Zoomed out, most of a trail collapses to a handful of pixels; there is no
+    point feeding draw.lines segments of zero visible length.
+    """
+    if len(points_px) < 3:
+        return points_px
+    diffs = np.abs(np.diff(points_px, axis=0)).max(axis=1)
+    keep = np.empty(len(points_px), dtype=bool)
+    keep[0] = True
+    np.greater_equal(diffs, 1, out=keep[1:])
+    return points_px[keep]
+
+
+def visible_runs(points_px: np.ndarray) -> List[np.ndarray]:
+    """Split a projected polyline into the runs that touch the window.
+
+    Points neighbouring an on-screen point are kept so segments crossing the
+    window edge still draw; fully off-screen stretches are dropped.
+    """
+    if len(points_px) < 2:
+        return []
+    margin = 64
+    x = points_px[:, 0]
+    y = points_px[:, 1]
+    inside = (
+        (x >= -margin)
+        & (x < WINDOW_WIDTH + margin)
+        & (y >= -margin)
+        & (y < WINDOW_HEIGHT + margin)
+    )
+    if inside.all():
+        return [points_px]
+    if not inside.any():
+        return []
+    keep = inside.copy()
+    keep[:-1] |= inside[1:]
+    keep[1:] |= inside[:-1]
+    idx = np.flatnonzero(keep)
+    breaks = np.flatnonzero(np.diff(idx) > 1) + 1
+    return [points_px[run] for run in np.split(idx, breaks) if len(run) >= 2]
+
+
+def draw_trails(
+    screen: pygame.Surface,
+    trails: Dict[int, Trail],
+    state: ViewerState,
+    cam_center: Sequence[float],
+    base_scale: float,
+    zoom_factor: float,
+    view_bounds: Tuple[float, float, float, float],
+) -> None:
+    # Submit all default-style trails back to back so SDL keeps the same
+    # color/width state between calls; the highlighted trail goes last.
+    wx_min, wx_max, wy_min, wy_max = view_bounds
+    selected_trail = None
+    trail_color = COLORS["trail"]
+    draw_lines = pygame.draw.lines
+    for body_id, trail in trails.items():
+        if trail.count < 2:
+            continue
+        if state.selected_id == body_id:
+            selected_trail = trail
+            continue
+        pts = trail.points()
+        lo = pts.min(axis=0)
+        hi = pts.max(axis=0)
+        if hi[0] < wx_min or lo[0] > wx_max or hi[1] < wy_min or lo[1] > wy_max:
+            continue
+        projected = decimate_polyline(
+            project_points(pts, cam_center, base_scale, zoom_factor)
+        )
+        for run in visible_runs(projected):
+            draw_lines(screen, trail_color, False, run, 1)
+    if selected_trail is not None:
+        projected = decimate_polyline(
+            project_points(selected_trail.points(), cam_center, base_scale, zoom_factor)
+        )
+        for run in visible_runs(projected):
+            draw_lines(screen, COLORS["fg_highlight"], False, run, 2)
+
+
+PLANET_CACHE_MAX_RADIUS_PX = 2048
+
+
+def draw_planet_layers(
     screen: pygame.Surface,
-    center: Tuple[int, int],
-    radius_m: Optional[float],
+    snapshot: Dict,
+    state: ViewerState,
+    origin_px: Tuple[int, int],
     base_scale: float,
     zoom_factor: float,
-    color: Tuple[int, int, int],
 ) -> None:
-    if radius_m is None:
-        return
-    radius_px = meters_to_pixels(radius_m, base_scale, zoom_factor)
-    if radius_px < 10:
-        return
-    if radius_px > max(WINDOW_WIDTH, WINDOW_HEIGHT) * 4:
+    """Draw the planet disc, outline, and well/despawn rings.
+
+    The radii only change on zoom, so the layers are rasterized once onto a
+    cached surface and blitted each frame. Layers too large for a reasonably
+    sized cache surface are drawn directly instead.
+    """
+    planet_radius_m = snapshot.get("planet_radius_m", 6_371_000.0)
+    planet_px = meters_to_pixels(planet_radius_m, base_scale, zoom_factor)
+
+    layers = [
+        (planet_px, COLORS["planet_fill"], 0),
+        (planet_px, COLORS["planet_outline"], 2),
+    ]
+    if state.selected_planet:
+        layers.append((planet_px + 4, COLORS["fg_highlight"], 2))
+    for radius_m, color in (
+        (snapshot.get("gravity_well_radius_m"), COLORS["ring_gravity"]),
+        (snapshot.get("despawn_radius_m"), COLORS["ring_despawn"]),
+    ):
+        if radius_m is None:
+            continue
+        radius_px = meters_to_pixels(radius_m, base_scale, zoom_factor)
+        if radius_px < 10 or radius_px > max(WINDOW_WIDTH, WINDOW_HEIGHT) * 4:
+            continue
+        layers.append((radius_px, color, 1))
+
+    max_radius_px = max(radius_px for radius_px, _, _ in layers)
+    if max_radius_px > PLANET_CACHE_MAX_RADIUS_PX:
+        for radius_px, color, width in layers:
+            pygame.draw.circle(screen, color, origin_px, radius_px, width=width)
         return
-    pygame.draw.circle(screen, color, center, radius_px, width=1)
+
+    key = tuple(layers)
+    if state._planet_cache is None or state._planet_cache[0] != key:
+        side = 2 * max_radius_px + 4
+        surface = pygame.Surface((side, side), pygame.SRCALPHA)
+        center = (side // 2, side // 2)
+        for radius_px, color, width in layers:
+            pygame.draw.circle(surface, color, center, radius_px, width=width)
+        state._planet_cache = (key, surface)
+    surface = state._planet_cache[1]
+    screen.blit(
+        surface,
+        (
+            origin_px[0] - surface.get_width() // 2,
+            origin_px[1] - surface.get_height() // 2,
+        ),
+    )
+
+
+# Hull geometry is static per body; cache the local vertex array and its
+# extent so the per-frame work is one small vectorized transform.
+_hull_cache: Dict[int, Tuple[np.ndarray, float]] = {}
 
 
 def draw_ship_outline(
@@ -464,37 +830,65 @@ def draw_ship_outline(
     hull = body.get("hull_shape")
     if not hull:
         return
-    vertices = hull.get("vertices") or []
-    if len(vertices) < 3:
-        return
+    cached = _hull_cache.get(body["id"])
+    if cached is None:
+        vertices = hull.get("vertices") or []
+        if len(vertices) < 3:
+            return
+        verts = np.array(
+            [(vertex.get("x", 0.0), vertex.get("y", 0.0)) for vertex in vertices],
+            dtype=np.float64,
+        )
+        cached = (verts, float(np.abs(verts).sum(axis=1).max()))
+        _hull_cache[body["id"]] = cached
+    verts, extent = cached
     scale = base_scale * zoom_factor
-    if scale <= 0.0:
-        return
-    max_radius_px = max(
-        int(abs(vertex.get("x", 0.0)) * scale) + int(abs(vertex.get("y", 0.0)) * scale)
-        for vertex in vertices
-    )
-    if max_radius_px < 6:
+    if scale <= 0.0 or int(extent * scale) < 6:
         return
-    points = []
-    base_x = body.get("x", 0.0)
-    base_y = body.get("y", 0.0)
-    for vertex in vertices:
-        wx = base_x + vertex.get("x", 0.0)
-        wy = base_y + vertex.get("y", 0.0)
-        points.append(world_to_screen(wx, wy, cam_center, base_scale, zoom_factor))
-    if len(points) >= 3:
-        pygame.draw.polygon(screen, COLORS["fg_dim"], points, width=1)
+    offset_x = WINDOW_WIDTH / 2.0 + (body.get("x", 0.0) - cam_center[0]) * scale
+    offset_y = WINDOW_HEIGHT / 2.0 - (body.get("y", 0.0) - cam_center[1]) * scale
+    points = np.empty_like(verts)
+    np.multiply(verts[:, 0], scale, out=points[:, 0])
+    np.multiply(verts[:, 1], -scale, out=points[:, 1])
+    points[:, 0] += offset_x
+    points[:, 1] += offset_y
+    pygame.draw.polygon(screen, COLORS["fg_dim"], points.astype(np.int32), width=1)
 
 
+_DISTANCE_UNITS = (
+    (1.0, "{:.0f} m"),
+    (1e3, "{:.2f} km"),
+    (1e6, "{:.2f} Mm"),
+    (1e9, "{:.2f} Gm"),
+)
+
+
+@lru_cache(maxsize=1024)
 def format_distance(meters: float) -> str:
     if meters < 1_000.0:
         return f"{meters:.0f} m"
-    if meters < 1_000_000.0:
-        return f"{meters / 1_000.0:.2f} km"
-    if meters < 1_000_000_000.0:
-        return f"{meters / 1_000_000.0:.2f} Mm"
-    return f"{meters / 1_000_000_000.0:.2f} Gm"
+    unit = min(len(_DISTANCE_UNITS) - 1, int(math.log10(meters)) // 3)
+    divisor, fmt = _DISTANCE_UNITS[unit]
+    return fmt.format(meters / divisor)
+
+
+@lru_cache(maxsize=256)
+def render_text(
+    font: pygame.font.Font, text: str, color: Tuple[int, int, int]
+) -> pygame.Surface:
+    """Cache rendered text surfaces; HUD strings change a few times a second
+    at most, while font.render rasterizes the full TrueType path each call."""
+    return font.render(text, True, color)
+
+
+@lru_cache(maxsize=128)
+def _hud_lines(sim_time_ds: int, sim_speed: float) -> Tuple[str, str]:
+    """Format HUD text keyed on sim_time quantized to 0.1 s, so paused and
+    repeated frames reuse both the strings and the cached text surfaces."""
+    return (
+        f"t = {sim_time_ds / 10.0:,.1f} s",
+        f"sim dt = {sim_speed:.1f} s/step",
+    )
 
 
 def draw_hud(screen: pygame.Surface, snapshot: Dict, state: ViewerState) -> None:
@@ -502,14 +896,11 @@ def draw_hud(screen: pygame.Surface, snapshot: Dict, state: ViewerState) -> None
         return
     font = FONT_SMALL
     sim_time = snapshot.get("sim_time", 0.0)
-    lines = [
-        f"t = {sim_time:,.1f} s",
-        f"sim dt = {state.sim_speed:.1f} s/step",
-    ]
+    lines = _hud_lines(round(sim_time * 10.0), state.sim_speed)
     x = HUD_MARGIN
     y = HUD_MARGIN
     for line in lines:
-        surface = font.render(line, True, COLORS["fg_main"])
+        surface = render_text(font, line, COLORS["fg_main"])
         screen.blit(surface, (x, y))
         y += font.get_linesize()
 
@@ -522,22 +913,21 @@ def draw_scale_marker(screen: pygame.Surface, state: ViewerState) -> None:
     scale = base_scale * zoom_factor
     if scale <= 0.0:
         return
-    candidate_lengths = [1, 2, 5]
-    meters = 1.0
+    # The marker is the smallest 1/2/5 length spanning at least 60 px, the
+    # same choice the old decade scan made; log10 jumps straight to the
+    # right decade instead of walking there every frame.
+    raw = 60.0 / scale
+    exponent = math.floor(math.log10(raw)) if raw >= 1.0 else 0
     chosen_length = None
     chosen_px = None
-    while meters < 1e9:
-        for base in candidate_lengths:
-            length = base * meters
-            pixels = int(length * scale)
-            if 60 <= pixels <= 240:
-                chosen_length = length
-                chosen_px = pixels
-                break
-        if chosen_length is not None:
+    for base in (1.0, 2.0, 5.0, 10.0, 20.0, 50.0):
+        length = base * 10.0 ** exponent
+        pixels = int(length * scale)
+        if pixels >= 60:
+            chosen_length = length
+            chosen_px = pixels
             break
-        meters *= 10.0
-    if chosen_length is None or chosen_px is None:
+    if chosen_length is None or chosen_px > 240 or chosen_length >= 1e9:
         return
     x2 = WINDOW_WIDTH - HUD_MARGIN
     x1 = x2 - chosen_px
@@ -546,7 +936,7 @@ def draw_scale_marker(screen: pygame.Surface, state: ViewerState) -> None:
     pygame.draw.line(screen, COLORS["fg_main"], (x1, y - 6), (x1, y + 6), width=2)
     pygame.draw.line(screen, COLORS["fg_main"], (x2, y - 6), (x2, y + 6), width=2)
     label = format_distance(chosen_length)
-    surface = FONT_SMALL.render(label, True, COLORS["fg_main"])
+    surface = render_text(FONT_SMALL, label, COLORS["fg_main"])
     rect = surface.get_rect()
     rect.midtop = ((x1 + x2) // 2, y + 8)
     screen.blit(surface, rect)
@@ -570,15 +960,39 @@ def draw_info_panel(screen: pygame.Surface, snapshot: Dict, state: ViewerState)
     pygame.draw.rect(screen, COLORS["info_border"], rect, 1)
 
     y = rect.top + padding
-    title_surface = FONT_MEDIUM.render(title, True, COLORS["fg_main"])
+    title_surface = render_text(FONT_MEDIUM, title, COLORS["fg_main"])
     screen.blit(title_surface, (rect.left + padding, y))
     y += title_height
     for line in lines:
-        surface = FONT_SMALL.render(line, True, COLORS["fg_main"])
+        surface = render_text(FONT_SMALL, line, COLORS["fg_main"])
         screen.blit(surface, (rect.left + padding, y))
         y += body_height
 
 
+@lru_cache(maxsize=64)
+def orbital_elements(
+    x: float, y: float, vx: float, vy: float, mu: float, planet_radius: float
+) -> Tuple[float, float, Optional[float]]:
+    """Return (altitude_m, speed_m_s, period_hours) for a body state.
+
+    Cached so redrawing the info panel for the same snapshot and selection
+    does not redo the vis-viva math.
+    """
+    r = math.hypot(x, y)
+    altitude = max(0.0, r - planet_radius)
+    speed = math.hypot(vx, vy)
+
+    period_hours = None
+    if mu > 0.0 and r > 0.0:
+        denom = 2.0 / r - (speed * speed) / mu
+        if abs(denom) > 1e-12:
+            semi_major_axis = 1.0 / denom
+            if semi_major_axis > 0.0:
+                period_seconds = 2.0 * math.pi * math.sqrt(semi_major_axis ** 3 / mu)
+                period_hours = period_seconds / 3600.0
+    return altitude, speed, period_hours
+
+
 def build_selection_info(snapshot: Dict, state: ViewerState) -> Optional[Tuple[str, List[str]]]:
     if state.selected_planet:
         planet_radius = snapshot.get("planet_radius_m", 6_371_000.0)
@@ -594,7 +1008,7 @@ def build_selection_info(snapshot: Dict, state: ViewerState) -> Optional[Tuple[s
     if state.selected_id is None:
         return None
 
-    body = next((b for b in snapshot.get("bodies", []) if b["id"] == state.selected_id), None)
+    body = snapshot.get("_by_id", {}).get(state.selected_id)
     if body is None:
         return None
 
@@ -607,19 +1021,7 @@ def build_selection_info(snapshot: Dict, state: ViewerState) -> Optional[Tuple[s
     planet_radius = snapshot.get("planet_radius_m", 6_371_000.0)
     mu = snapshot.get("mu", 0.0)
 
-    r = math.hypot(x, y)
-    altitude = max(0.0, r - planet_radius)
-    speed = math.hypot(vx, vy)
-
-    semi_major_axis = None
-    if mu > 0.0 and r > 0.0:
-        denom = 2.0 / r - (speed * speed) / mu
-        if abs(denom) > 1e-12:
-            semi_major_axis = 1.0 / denom
-    period_hours = None
-    if semi_major_axis and semi_major_axis > 0.0 and mu > 0.0:
-        period_seconds = 2.0 * math.pi * math.sqrt(semi_major_axis ** 3 / mu)
-        period_hours = period_seconds / 3600.0
+    altitude, speed, period_hours = orbital_elements(x, y, vx, vy, mu, planet_radius)
 
     lines = [
         f"Alt: {format_distance(altitude)}",
@@ -632,39 +1034,79 @@ def build_selection_info(snapshot: Dict, state: ViewerState) -> Optional[Tuple[s
     return f"ID {body['id']} ({body_type})", lines
 
 
+def snapshot_reader(conn: ServerConnection, latest: List[Optional[Dict]]) -> None:
+    """Parse snapshots off the render thread; only the newest one is kept."""
+    while conn.running:
+        line = conn.readline()
+        if not line.strip():
+            continue
+        try:
+            snapshot = json_loads(line)
+        except ValueError:
+            continue
+        prepare_snapshot(snapshot)
+        latest[0] = snapshot
+
+
 def main() -> None:
     screen = init_pygame()
     conn = ServerConnection()
-    trails: Dict[int, Deque[Tuple[float, float]]] = defaultdict(
-        lambda: deque(maxlen=TRAIL_LENGTH)
-    )
+    trails = make_trails()
     state = ViewerState()
     snapshot: Optional[Dict] = None
-
+    latest: List[Optional[Dict]] = [None]
+    threading.Thread(
+        target=snapshot_reader, args=(conn, latest), daemon=True
+    ).start()
+
+    clock = pygame.time.Clock()
+    last_view_key: Optional[tuple] = None
+    prev_ids = np.empty(0, dtype=np.int64)
     try:
         while True:
             if not handle_events(snapshot, state, conn):
                 break
 
-            line = conn.readline()
-            if not line:
+            fresh = latest[0]
+            is_new = fresh is not None and fresh is not snapshot
+            if is_new:
+                snapshot = fresh
+                ensure_base_scale(snapshot, state)
+                current_ids = snapshot["_ids"]
+                # The body set rarely changes; one array compare almost
+                # always replaces the per-frame set building and pruning.
+                if not np.array_equal(current_ids, prev_ids):
+                    removed = set(prev_ids.tolist()) - set(current_ids.tolist())
+                    for removed_id in removed:
+                        trails.pop(removed_id, None)
+                        _hull_cache.pop(removed_id, None)
+                    prev_ids = current_ids
+                update_trails(trails, snapshot)
+
+            if snapshot is None:
+                clock.tick(240)
                 continue
 
-            try:
-                snapshot = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            ensure_base_scale(snapshot, state)
             update_camera_center(snapshot, state)
-            current_ids = {body["id"] for body in snapshot.get("bodies", [])}
-            prune_trails(trails, current_ids)
-            update_trails(trails, snapshot)
+            view_key = (
+                state.zoom_factor,
+                tuple(state.camera_center_world),
+                state.selected_id,
+                state.selected_planet,
+                state.sim_speed,
+            )
+            if not is_new and view_key == last_view_key:
+                # Neither the snapshot nor the view changed; keep the frame
+                # but keep polling events at a responsive rate.
+                clock.tick(240)
+                continue
             draw_snapshot(screen, snapshot, trails, state)
+            last_view_key = view_key
+            clock.tick(60)
     except KeyboardInterrupt:
         pass
     finally:
-        conn.close()
+        conn.shutdown()
         pygame.quit()
 
 
@@ -6,11 +6,34 @@ from __future__ import annotations
 import json
 import math
 import socket
+import threading
 import time
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import pygame
 
+# Prefer the C-extension JSON codecs when present; interior snapshots carry
+# the full tile grid, so decode speed directly bounds interactivity. Every
+# option takes and produces bytes.
+try:
+    from msgspec.json import decode as json_loads
+except ImportError:
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+try:
+    from msgspec.json import encode as json_dumps
+except ImportError:
+    try:
+        from orjson import dumps as json_dumps
+    except ImportError:
+
+        def json_dumps(payload: Any) -> bytes:
+            return json.dumps(payload).encode("utf-8")
+
+
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 900
 MARGIN = 120
@@ -96,17 +119,28 @@ class ViewerState:
         self.nav_comms_log: List[str] = list(DEFAULT_COMMS_LOG)
         self.nav_comms_selected: int = 0
         self.shipcomp_selection: int = 0
+        self.tile_layer_surface: Optional[pygame.Surface] = None
+        self.tile_layer_key: Optional[Tuple] = None
 
 
 class ServerConnection:
+    """Connection shared between the reader thread and main-thread senders.
+
+    A lock guards socket setup and teardown so a failing send cannot clobber
+    the socket mid-reconnect; shutdown is signalled via the running flag,
+    after which readline returns empty bytes.
+    """
+
     def __init__(self) -> None:
         self.addr = (SERVER_HOST, SERVER_PORT)
         self.sock: Optional[socket.socket] = None
         self.sock_file = None
+        self.running = True
+        self._lock = threading.Lock()
         self.connect()
 
     def connect(self) -> None:
-        while True:
+        while self.running:
             try:
                 sock = socket.create_connection(self.addr)
             except OSError:
@@ -116,12 +150,31 @@ class ServerConnection:
                 )
                 time.sleep(1.0)
                 continue
-            self.sock = sock
-            self.sock_file = sock.makefile("r", encoding="utf-8")
+            # Move commands are tiny; Nagle would sit on them for no reason.
+            # Generous kernel buffers absorb a whole tile-grid snapshot
+            # between reads.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            with self._lock:
+                if not self.running:
+                    sock.close()
+                    return
+                self.sock = sock
+                self.sock_file = sock.makefile("rb", buffering=1 << 16)
             print("Connected to GGW server.", flush=True)
             break
 
     def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self.running = False
+            self._close_locked()
+
+    def _close_locked(self) -> None:
         if self.sock_file is not None:
             try:
                 self.sock_file.close()
@@ -135,30 +188,37 @@ class ServerConnection:
         self.sock = None
         self.sock_file = None
 
-    def readline(self) -> str:
-        while True:
-            if self.sock_file is None:
+    def readline(self) -> bytes:
+        while self.running:
+            sock_file = self.sock_file
+            if sock_file is None:
                 self.connect()
                 continue
             try:
-                line = self.sock_file.readline()
-            except OSError:
+                line = sock_file.readline()
+            except (OSError, ValueError):
+                # ValueError: another thread closed the file under us while
+                # reconnecting after a failed send.
                 self.close()
                 continue
-            if line == "":
+            if not line:
+                if not self.running:
+                    break
                 print("Connection to GGW server lost, reconnecting...", flush=True)
                 self.close()
                 continue
             return line
+        return b""
 
     def send_json(self, payload: Dict[str, Any]) -> None:
-        data = (json.dumps(payload) + "\n").encode("utf-8")
-        while True:
-            if self.sock is None:
+        data = json_dumps(payload) + b"\n"
+        while self.running:
+            sock = self.sock
+            if sock is None:
                 self.connect()
+                continue
             try:
-                assert self.sock is not None
-                self.sock.sendall(data)
+                sock.sendall(data)
                 return
             except OSError:
                 print("Send failed, reconnecting to GGW server...", flush=True)
@@ -190,6 +250,8 @@ def ensure_layout(interior: Dict, state: ViewerState) -> None:
         tile_h = usable_h / height
         state.base_tile_size = max(8.0, min(tile_w, tile_h))
     tile_size = max(8, int(state.base_tile_size * state.zoom))
+    if tile_size != state.tile_size:
+        _TILE_CACHE.clear()
     state.tile_size = tile_size
 
 
@@ -331,6 +393,10 @@ def handle_events(
     conn: ServerConnection, state: ViewerState, snapshot: Optional[Dict]
 ) -> bool:
     modal_open = state.modal_device_id is not None
+    # Key repeat can queue several move presses per frame; net them out and
+    # send one command instead of a socket write per event.
+    net_dx = 0
+    net_dy = 0
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             return False
@@ -352,7 +418,8 @@ def handle_events(
                 continue
             elif not modal_open and event.key in MOVE_KEYS:
                 dx, dy = MOVE_KEYS[event.key]
-                send_move_command(conn, dx, dy)
+                net_dx += dx
+                net_dy += dy
             elif not modal_open and event.key == pygame.K_SPACE:
                 send_toggle_sleep(conn)
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -366,6 +433,12 @@ def handle_events(
                 state.zoom = clamp(state.zoom * ZOOM_STEP, ZOOM_MIN, ZOOM_MAX)
             elif event.button == 5:
                 state.zoom = clamp(state.zoom / ZOOM_STEP, ZOOM_MIN, ZOOM_MAX)
+    if net_dx or net_dy:
+        send_move_command(
+            conn,
+            max(-1, min(1, net_dx)),
+            max(-1, min(1, net_dy)),
+        )
     return True
 
 
@@ -491,17 +564,7 @@ def draw_snapshot(screen: pygame.Surface, snapshot: Dict, state: ViewerState) ->
     tile_size = state.tile_size
     offset_x, offset_y = state.offset
 
-    tiles = interior.get("tiles", [])
-    for y, row in enumerate(tiles):
-        for x, entry in enumerate(row):
-            tile_name, _ = parse_tile_entry(entry)
-            rect = pygame.Rect(
-                offset_x + x * tile_size,
-                offset_y + y * tile_size,
-                tile_size,
-                tile_size,
-            )
-            draw_tile(screen, rect, tile_name)
+    screen.blit(tile_layer(interior, state), (offset_x, offset_y))
 
     draw_devices(screen, interior.get("devices", []), state)
     draw_pawn(screen, interior.get("pawn"), tile_size, offset_x, offset_y)
@@ -511,6 +574,68 @@ def draw_snapshot(screen: pygame.Surface, snapshot: Dict, state: ViewerState) ->
     pygame.display.flip()
 
 
+# There are only a handful of tile types at any one tile size, so each
+# (name, size) combination is rasterized once and blitted thereafter instead
+# of re-issuing two draw.rect calls per tile per frame.
+_TILE_CACHE: Dict[Tuple[str, int], pygame.Surface] = {}
+
+
+def tile_type_key(tiles: List) -> Tuple[str, ...]:
+    """Flatten the grid to its tile type names.
+
+    This runs once per snapshot over every tile, so the wire format (a dict
+    with a "type" field) gets a fast path that skips the parse_tile_entry
+    call per entry; anything else falls back to the full parser.
+    """
+    names: List[str] = []
+    for row in tiles:
+        names.extend(
+            entry["type"]
+            if type(entry) is dict and "type" in entry
+            else parse_tile_entry(entry)[0]
+            for entry in row
+        )
+    return tuple(names)
+
+
+def tile_layer(interior: Dict, state: ViewerState) -> pygame.Surface:
+    """Return the whole tile grid baked into one surface.
+
+    The grid only changes when a door toggles or the zoom level moves, so
+    most frames reduce to a single blit. The key is built from tile types
+    alone; atmosphere samples change every snapshot but do not affect how a
+    tile looks.
+    """
+    tiles = interior.get("tiles", [])
+    tile_size = state.tile_size
+    names = tile_type_key(tiles)
+    key = (tile_size, interior.get("width", 0), interior.get("height", 0), names)
+    if key != state.tile_layer_key:
+        width = max(1, len(tiles[0]) if tiles else 1)
+        height = max(1, len(tiles))
+        surface = pygame.Surface((width * tile_size, height * tile_size))
+        for y, row in enumerate(tiles):
+            for x, entry in enumerate(row):
+                tile_name, _ = parse_tile_entry(entry)
+                surface.blit(
+                    tile_surface(tile_name, tile_size),
+                    (x * tile_size, y * tile_size),
+                )
+        state.tile_layer_surface = surface
+        state.tile_layer_key = key
+    return state.tile_layer_surface
+
+
+def tile_surface(tile_name: str, tile_size: int) -> pygame.Surface:
+    key = (tile_name, tile_size)
+    surface = _TILE_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface((tile_size, tile_size))
+        draw_tile(surface, pygame.Rect(0, 0, tile_size, tile_size), tile_name)
+        _TILE_CACHE[key] = surface
+    return surface
+
+
 def draw_tile(screen: pygame.Surface, rect: pygame.Rect, tile_name: str) -> None:
     name = tile_name or "Empty"
     if name == "Wall":
@@ -531,6 +656,11 @@ def draw_tile(screen: pygame.Surface, rect: pygame.Rect, tile_name: str) -> None
     pygame.draw.rect(screen, COLORS["grid"], rect, width=1)
 
 
+# Device labels come from the fixed two-letter set in device_label; render
+# each one once instead of rasterizing the font every device every frame.
+_LABEL_CACHE: Dict[str, pygame.Surface] = {}
+
+
 def draw_devices(screen: pygame.Surface, devices: List[Dict], state: ViewerState) -> None:
     tile_size = state.tile_size
     offset_x, offset_y = state.offset
@@ -557,7 +687,10 @@ def draw_devices(screen: pygame.Surface, devices: List[Dict], state: ViewerState
         if labels and FONT_SMALL is not None:
             code = device_label(kind)
             if code:
-                text = FONT_SMALL.render(code, True, COLORS["bg"])
+                text = _LABEL_CACHE.get(code)
+                if text is None:
+                    text = FONT_SMALL.render(code, True, COLORS["bg"])
+                    _LABEL_CACHE[code] = text
                 text_rect = text.get_rect(center=rect.center)
                 screen.blit(text, text_rect)
         if kind == "DoorDevice":
@@ -777,9 +910,13 @@ def draw_nav_radar(
     ship_radius = math.hypot(ship_x, ship_y)
     max_range = max(planet_radius + 1.0, ship_radius)
     max_range = max(max_range, planet_radius + float(nav_context.get("apoapsis_m", 0.0)))
-    for contact in nav_context.get("contacts", []):
-        cx = float(contact.get("x_m", 0.0))
-        cy = float(contact.get("y_m", 0.0))
+    # Pull the contact coordinates out once; they are needed both for the
+    # range fit and for plotting below.
+    contacts_xy = [
+        (float(contact.get("x_m", 0.0)), float(contact.get("y_m", 0.0)))
+        for contact in nav_context.get("contacts", [])
+    ]
+    for cx, cy in contacts_xy:
         max_range = max(max_range, math.hypot(cx, cy))
     scale = max_radius / max(max_range, 1.0)
     planet_px = max(4, int(planet_radius * scale))
@@ -802,9 +939,7 @@ def draw_nav_radar(
             int(ship_point[1] - vy * 40),
         )
         pygame.draw.line(screen, COLORS["highlight"], ship_point, arrow_end, 2)
-    for contact in nav_context.get("contacts", []):
-        cx = float(contact.get("x_m", 0.0))
-        cy = float(contact.get("y_m", 0.0))
+    for cx, cy in contacts_xy:
         point = (
             int(center[0] + cx * scale),
             int(center[1] - cy * scale),
@@ -1250,30 +1385,64 @@ def prune_selection(state: ViewerState, interior: Dict) -> None:
             state.selected_device_id = None
 
 
+def snapshot_reader(conn: ServerConnection, latest: List[Optional[Dict]]) -> None:
+    """Parse snapshots off the render thread; only the newest one is kept."""
+    while conn.running:
+        line = conn.readline()
+        if not line.strip():
+            continue
+        try:
+            snapshot = json_loads(line)
+        except ValueError:
+            continue
+        latest[0] = snapshot
+
+
 def main() -> None:
     screen = init_pygame()
     conn = ServerConnection()
     state = ViewerState()
     snapshot: Optional[Dict] = None
+    latest: List[Optional[Dict]] = [None]
+    threading.Thread(
+        target=snapshot_reader, args=(conn, latest), daemon=True
+    ).start()
 
+    clock = pygame.time.Clock()
+    last_view_key: Optional[tuple] = None
     try:
         while True:
             if not handle_events(conn, state, snapshot):
                 break
 
-            line = conn.readline().strip()
-            if not line:
+            fresh = latest[0]
+            is_new = fresh is not None and fresh is not snapshot
+            if is_new:
+                snapshot = fresh
+            if snapshot is None or not snapshot.get("interior"):
+                clock.tick(60)
                 continue
 
-            snapshot = json.loads(line)
-            interior = snapshot.get("interior")
-            if interior:
-                prune_selection(state, interior)
+            if is_new:
+                prune_selection(state, snapshot["interior"])
+            view_key = (
+                state.zoom,
+                state.selected_device_id,
+                state.modal_device_id,
+                state.context_tile,
+                state.navstation_tab,
+                state.nav_comms_selected,
+                state.shipcomp_selection,
+                len(state.nav_comms_log),
+            )
+            if is_new or view_key != last_view_key:
                 draw_snapshot(screen, snapshot, state)
+                last_view_key = view_key
+            clock.tick(60)
     except KeyboardInterrupt:
         pass
     finally:
-        conn.close()
+        conn.shutdown()
         pygame.quit()
 
 
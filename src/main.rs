@@ -1,6 +1,7 @@
 use std::cmp::Ordering;
 use std::env;
 use std::f64::consts::{FRAC_PI_4, PI};
+use std::fmt::Write as _;
 use std::io::{self, BufRead, BufReader, BufWriter, Write};
 use std::net::{TcpListener, TcpStream};
 use std::sync::mpsc;
@@ -310,7 +311,11 @@ fn sample_body(
 }
 
 fn build_snapshot_json(world: &World) -> String {
-    let mut json = format!(
+    // Preallocate roughly what a snapshot needs and write fields in place;
+    // format! + push_str allocated a temporary String per body per tick.
+    let mut json = String::with_capacity(1024 + world.bodies.len() * 192);
+    let _ = write!(
+        json,
         "{{\"sim_time\":{},\"planet_radius_m\":{},\"gravity_well_radius_m\":{},\"despawn_radius_m\":{},\"mu\":{},\"bodies\":[",
         world.sim_time,
         world.planet_radius,
@@ -324,7 +329,8 @@ fn build_snapshot_json(world: &World) -> String {
             json.push(',');
         }
         json.push('{');
-        json.push_str(&format!(
+        let _ = write!(
+            json,
             "\"id\":{},\"body_type\":\"{}\",\"radius_m\":{},\"x\":{},\"y\":{},\"vx\":{},\"vy\":{}",
             body.id,
             body_type_name(body.body_type),
@@ -333,16 +339,16 @@ fn build_snapshot_json(world: &World) -> String {
             body.position.y,
             body.velocity.x,
             body.velocity.y
-        ));
+        );
         if let Some(hull) = &body.hull_shape {
             json.push_str(",\"hull_shape\":{");
-            json.push_str(&format!("\"tile_size_m\":{}", TILE_SIZE_METERS));
+            let _ = write!(json, "\"tile_size_m\":{}", TILE_SIZE_METERS);
             json.push_str(",\"vertices\":[");
             for (idx, vertex) in hull.vertices.iter().enumerate() {
                 if idx > 0 {
                     json.push(',');
                 }
-                json.push_str(&format!("{{\"x\":{},\"y\":{}}}", vertex.x, vertex.y));
+                let _ = write!(json, "{{\"x\":{},\"y\":{}}}", vertex.x, vertex.y);
             }
             json.push_str("]}");
         }
@@ -365,12 +371,12 @@ fn build_interior_json(
     config: &GameConfig,
 ) -> String {
     let ship = &interior.ship;
-    let mut json = String::new();
+    let mut json = String::with_capacity(8192);
     json.push_str("\"interior\":{");
-    json.push_str(&format!(
+    let _ = write!(json,
         "\"width\":{},\"height\":{},",
         ship.width, ship.height
-    ));
+    );
     json.push_str("\"tiles\":[");
     for y in 0..ship.height {
         if y > 0 {
@@ -383,12 +389,12 @@ fn build_interior_json(
             }
             let tile_type = ship.tile_type(x, y);
             json.push('{');
-            json.push_str(&format!("\"type\":\"{}\"", tile_type.as_str()));
+            let _ = write!(json, "\"type\":\"{}\"", tile_type.as_str());
             if let Some(sample) = ship.tile_atmos_sample(x, y, &config.atmosphere) {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"atmos\":{{\"pressure_kpa\":{},\"o2_kg\":{},\"n2_kg\":{},\"co2_kg\":{}}}",
                     sample.pressure_kpa, sample.o2_kg, sample.n2_kg, sample.co2_kg
-                ));
+                );
             } else {
                 json.push_str(",\"atmos\":null");
             }
@@ -408,7 +414,7 @@ fn build_interior_json(
             json.push(',');
         }
         json.push('{');
-        json.push_str(&format!(
+        let _ = write!(json,
             "\"id\":{},\"kind\":\"{}\",\"x\":{},\"y\":{},\"w\":{},\"h\":{},\"online\":{},\"power_kw\":{}",
             device.id,
             device.device_type.as_str(),
@@ -418,26 +424,26 @@ fn build_interior_json(
             device.h,
             if device.online { "true" } else { "false" },
             device.power_kw
-        ));
+        );
         match &device.data {
             DeviceData::Reactor(data) => {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"fuel_kg\":{},\"max_fuel_kg\":{},\"power_output_kw\":{},\"fuel_burn_rate_kg_per_s\":{},\"reactor_online\":{}",
                     data.fuel_kg,
                     data.max_fuel_kg,
                     data.power_output_kw,
                     data.fuel_burn_rate_kg_per_s,
                     if data.online { "true" } else { "false" }
-                ));
+                );
             }
             DeviceData::Tank(data) => {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"o2_kg\":{},\"n2_kg\":{},\"co2_kg\":{},\"xenon_kg\":{},\"capacity_kg\":{}",
                     data.o2_kg, data.n2_kg, data.co2_kg, data.xenon_kg, data.capacity_kg
-                ));
+                );
             }
             DeviceData::Dispenser(data) => {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"active\":{},\"rate_kg_per_s\":{},\"gas_type\":\"{}\",\"connected_tank_id\":{}",
                     if data.active { "true" } else { "false" },
                     data.rate_kg_per_s,
@@ -446,48 +452,48 @@ fn build_interior_json(
                         .connected_tank_id
                         .map(|id| id.to_string())
                         .unwrap_or_else(|| "null".to_string())
-                ));
+                );
             }
             DeviceData::Light(data) => {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"intensity\":{},\"light_online\":{}",
                     data.intensity,
                     if data.online { "true" } else { "false" }
-                ));
+                );
             }
             DeviceData::NavStation(data) => {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"nav_online\":{}",
                     if data.online { "true" } else { "false" }
-                ));
+                );
             }
             DeviceData::Transponder(data) => {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"callsign\":\"{}\",\"transponder_online\":{},\"dm_code\":{}",
                     data.callsign,
                     if data.online { "true" } else { "false" },
                     data.dm_code
-                ));
+                );
             }
             DeviceData::ShipComputer(data) => {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"ship_computer_online\":{}",
                     if data.online { "true" } else { "false" }
-                ));
+                );
             }
             DeviceData::DoorDevice(data) => {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"open\":{}",
                     if data.open { "true" } else { "false" }
-                ));
+                );
             }
             DeviceData::FoodGenerator(data) => {
-                json.push_str(&format!(
+                let _ = write!(json,
                     ",\"food_units\":{},\"max_food_units\":{},\"food_online\":{}",
                     data.food_units,
                     data.max_food_units,
                     if data.online { "true" } else { "false" }
-                ));
+                );
             }
             DeviceData::BedDevice(_)
             | DeviceData::Toilet(_)
@@ -499,24 +505,24 @@ fn build_interior_json(
     }
     json.push_str("],");
     let totals = ship.total_atmos();
-    json.push_str(&format!(
+    let _ = write!(json,
         "\"atmos_totals\":{{\"o2_kg\":{},\"n2_kg\":{},\"co2_kg\":{}}},",
         totals.o2_kg, totals.n2_kg, totals.co2_kg
-    ));
-    json.push_str(&format!(
+    );
+    let _ = write!(json,
         "\"power\":{{\"net_kw\":{},\"total_production_kw\":{},\"total_consumption_kw\":{}}},",
         ship.power.net_kw, ship.power.total_production_kw, ship.power.total_consumption_kw
-    ));
+    );
     let summary = &ship.power_summary;
-    json.push_str(&format!(
+    let _ = write!(json,
         "\"power_summary\":{{\"generation_kw\":{},\"load_kw\":{},\"net_kw\":{},\"devices\":[",
         summary.generation_kw, summary.load_kw, summary.net_kw
-    ));
+    );
     for (idx, device) in summary.devices.iter().enumerate() {
         if idx > 0 {
             json.push(',');
         }
-        json.push_str(&format!(
+        let _ = write!(json,
             "{{\"id\":{},\"name\":\"{}\",\"group\":\"{}\",\"draw_kw\":{},\"online\":{},\"controllable\":{}}}",
             device.id,
             device.name,
@@ -524,34 +530,34 @@ fn build_interior_json(
             device.draw_kw,
             if device.online { "true" } else { "false" },
             if device.controllable { "true" } else { "false" }
-        ));
+        );
     }
     json.push_str("]},");
     let pawn = &interior.pawn;
     json.push_str("\"pawn\":{");
-    json.push_str(&format!(
+    let _ = write!(json,
         "\"x\":{},\"y\":{},\"status\":\"{}\",\"suffocation_time\":{}",
         pawn.x,
         pawn.y,
         pawn.status.as_str(),
         pawn.suffocation_time
-    ));
-    json.push_str(&format!(
+    );
+    let _ = write!(json,
         ",\"needs\":{{\"hunger\":{},\"thirst\":{},\"rest\":{}}}",
         pawn.needs.hunger, pawn.needs.thirst, pawn.needs.rest
-    ));
+    );
     json.push_str(",\"health\":{\"body_parts\":[");
     for (idx, part) in pawn.health.body_parts.iter().enumerate() {
         if idx > 0 {
             json.push(',');
         }
-        json.push_str(&format!(
+        let _ = write!(json,
             "{{\"name\":\"{}\",\"hp\":{},\"max_hp\":{},\"vital\":{}}}",
             part.name,
             part.hp,
             part.max_hp,
             if part.vital { "true" } else { "false" }
-        ));
+        );
     }
     json.push_str("]}");
     json.push('}');
@@ -631,10 +637,11 @@ fn nav_context_json(world: &World) -> Option<String> {
         if index > 0 {
             nav_json.push(',');
         }
-        nav_json.push_str(&format!(
+        let _ = write!(
+            nav_json,
             "{{\"id\":{},\"body_type\":\"{}\",\"x_m\":{},\"y_m\":{}}}",
             id, kind, x, y
-        ));
+        );
     }
     nav_json.push_str("]}");
     Some(nav_json)